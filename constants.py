@@ -2,9 +2,13 @@ DRIVERPATH = './chromedriver'
 HOMEPAGE = 'http://www.frostbank.com'
 DISPLAY_COLUMNS = ['ATTORNEY', 'NAME', 'DOI', 'IOLTA to Business', 'MKT ACCT', 'CASH\'S LOAN', 'BUILDING BONUS']
 REQUIRED_COLUMNS = ['NAME', "IOLTA to Business", 'MKT ACCT', "CASH'S LOAN", "BUILDING BONUS"]
+AMOUNT_COLUMNS = ["IOLTA to Business", 'MKT ACCT', "CASH'S LOAN", "BUILDING BONUS"]
+SETTLEMENT_COLUMNS = set(DISPLAY_COLUMNS) | set(REQUIRED_COLUMNS)
+COLUMN_DTYPES = {'NAME': 'string', 'IOLTA to Business': 'float64', 'MKT ACCT': 'float64', "CASH'S LOAN": 'float64', 'BUILDING BONUS': 'float64'}
 IOLTA_ACCT_NUM = 530036684
 OPERATING_ACCT_NUM = 502388766
 MARKETING_ACCT_NUM = 694033027
 CASH_ACCT_NUM = 694032705
 BUILDING_ACCT_NUM = 694032896
-SPEED_FACTOR = 0.5
\ No newline at end of file
+SPEED_FACTOR = 0.5
+N_BROWSERS = 1
\ No newline at end of file
@@ -1,16 +1,64 @@
+import random
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from getpass import getpass
 import pandas as pd
-import numpy as np
-import xlrd
-from tabulate import tabulate
-from selenium import webdriver
-from selenium.webdriver.common.keys import Keys
-from selenium.webdriver.common.action_chains import ActionChains
 
 import constants
 
+# Locates the transfer form elements in one round trip (see locate_transfer_form). Account rows are only looked up once their dropdown is open.
+TRANSFER_FORM_SCRIPT = """
+return {
+    "from": document.getElementById("from-account-list"),
+    "to": document.getElementById("to-account-list"),
+    "amount": document.getElementById("amount"),
+    "memo": document.getElementById("memo"),
+    "next": document.getElementById("btn-next")
+};
+"""
+
+# Account details for each transfer made per settlement, paired with the SettlementCase attribute holding its amount.
+TRANSFER_TEMPLATES = (
+    (
+        dict(
+            from_acct="Iolta",
+            to_acct="Operating",
+            from_acct_num=str(constants.IOLTA_ACCT_NUM),
+            to_acct_num=str(constants.OPERATING_ACCT_NUM),
+        ),
+        "amount_iolta_to_operating",
+    ),
+    (
+        dict(
+            from_acct="Operating",
+            to_acct="Marketing",
+            from_acct_num=str(constants.OPERATING_ACCT_NUM),
+            to_acct_num=str(constants.MARKETING_ACCT_NUM),
+        ),
+        "amount_operating_to_marketing",
+    ),
+    (
+        dict(
+            from_acct="Operating",
+            to_acct="Cash Loan Repayment Fund",
+            from_acct_num=str(constants.OPERATING_ACCT_NUM),
+            to_acct_num=str(constants.CASH_ACCT_NUM),
+        ),
+        "amount_operating_to_cash",
+    ),
+    (
+        dict(
+            from_acct="Operating",
+            to_acct="Building",
+            from_acct_num=str(constants.OPERATING_ACCT_NUM),
+            to_acct_num=str(constants.BUILDING_ACCT_NUM),
+        ),
+        "amount_operating_to_building",
+    ),
+)
+
 # TODO: Find way to wrap each action in a random wait time using decorators
 # TODO: Check that key columns have values
 # TODO: Review which columns the transfer values come from
@@ -54,8 +102,12 @@ class SettlementData:
             - file_path (str): Path to settlement spreadsheet (which should be in XLSX format)
         """
         self.file_path = file_path
-        self.sheet_name = self.get_settlement_sheet_name(file_path)
-        self.settlements_df = self.read_settlements_file(file_path, sheet_name=self.sheet_name)
+        xl_file = pd.ExcelFile(file_path, engine="calamine")
+        try:
+            self.sheet_name = self.get_settlement_sheet_name(xl_file)
+            self.settlements_df = self.read_settlements_file(xl_file, sheet_name=self.sheet_name)
+        finally:
+            xl_file.close()
         self.preprocess_settlements_df()
         self.validate_columns()
         self.settlement_rows = self.select_settlements_by_row()
@@ -64,67 +116,90 @@ class SettlementData:
         """
         Validate that required columns exist in the selected spreadsheet
         """
-        missing_columns = set(constants.REQUIRED_COLUMNS) - set(self.settlements_df.columns)
+        missing_columns = pd.Index(constants.REQUIRED_COLUMNS).difference(self.settlements_df.columns)
         if len(missing_columns) != 0:
-            print(f"Columns {missing_columns} are missing from the spreadsheet. Please ensure that these columns exist and are spelled correctly before attempting a transfer.")
+            print(f"Columns {list(missing_columns)} are missing from the spreadsheet. Please ensure that these columns exist and are spelled correctly before attempting a transfer.")
             sys.exit()
     
-    def get_settlement_sheet_name(self, file_path):
+    def get_settlement_sheet_name(self, xl_file):
         """
-        Get name of desired sheet from excel file to perform transfers on.
+        Get name of desired sheet from excel file (pandas.ExcelFile) to perform transfers on.
         """
-        xl_file = pd.ExcelFile(file_path, engine="openpyxl")
         sheet_names = xl_file.sheet_names
+        sheet_names_set = set(sheet_names)
         desired_sheet = input("Which sheet would you like to select for transfers?\n")
-        while desired_sheet not in sheet_names:
+        while desired_sheet not in sheet_names_set:
             desired_sheet = input(f"Sheet not found. Please enter a sheet from the following list:\n{sheet_names}\n")
         return desired_sheet
 
-    def read_settlements_file(self, file_path, **kwargs):
+    def read_settlements_file(self, xl_file, **kwargs):
         """
-        Read XLSX file containing settlement information at file_path
+        Read settlement information from the opened XLSX file xl_file (pandas.ExcelFile). Only the columns in constants.SETTLEMENT_COLUMNS are parsed.
         """
-        df = pd.read_excel(file_path, engine="openpyxl", **kwargs)
+        df = pd.read_excel(
+            xl_file,
+            usecols=lambda col: str(col).strip() in constants.SETTLEMENT_COLUMNS,
+            **kwargs,
+        )
         return df
 
     def preprocess_settlements_df(self):
         """
         Preprocess settlements_df using the following steps
             1. Strip leading and lagging whitespaces in column names
-            2. Drop empty rows and columns
+            2. Cast transfer columns to the types in constants.COLUMN_DTYPES
+            3. Treat blank transfer amounts as 0, so only a missing client NAME makes a row unavailable
+            4. Drop empty columns and rows without a client NAME
         """
-        self.settlements_df.columns = [
-            col.strip() for col in self.settlements_df.columns
-        ]
-        self.settlements_df = self.settlements_df.dropna(axis=1, how="all")
-        self.settlements_df = self.settlements_df.dropna(
-            axis=0, subset=constants.REQUIRED_COLUMNS
-        )
+        self.settlements_df.columns = self.settlements_df.columns.str.strip()
+        self.cast_column_dtypes()
+        self.settlements_df = self.settlements_df.fillna({
+            col: 0 for col in constants.AMOUNT_COLUMNS if col in self.settlements_df.columns
+        })
+        keep_cols = self.settlements_df.columns[self.settlements_df.notna().any(axis=0)]
+        keep_rows = self.settlements_df[constants.REQUIRED_COLUMNS].notna().all(axis=1)
+        self.settlements_df = self.settlements_df.loc[keep_rows, keep_cols]
+
+    def cast_column_dtypes(self):
+        """
+        Cast transfer columns of settlements_df to the types in constants.COLUMN_DTYPES, aborting if a cell cannot be converted.
+        """
+        for col, dtype in constants.COLUMN_DTYPES.items():
+            if col not in self.settlements_df.columns:
+                continue
+            try:
+                self.settlements_df[col] = self.settlements_df[col].astype(dtype)
+            except (ValueError, TypeError):
+                values = self.settlements_df[col]
+                bad_cells = values[values.notna() & pd.to_numeric(values, errors="coerce").isna()]
+                bad_cells = {row + 2: value for row, value in bad_cells.items()}
+                print(f"Column {col} contains cells that are not numbers (row: value): {bad_cells}. Please correct these cells before attempting a transfer.")
+                sys.exit()
 
     def select_settlements_by_row(self):
         """
         Select a settlement from self.settlements_df based on the corresponding row from the raw Excel spreadsheet.
         """
-        row_input = input("Which row numbers would you like to perform a transfer for?\n")
-        rows = self.parse_row_input(row_input)
-        idxs = [row - 2 for row in rows]
-        try:
-            sub_df = self.settlements_df.loc[idxs]
-        except KeyError:
-            print(f"Row unavailable for transfer. Please ensure that the following required columns are filled out:\n{constants.REQUIRED_COLUMNS}")
-            return self.select_settlements_by_row()
-        
-        input_confirmed = self.row_input_is_correct(sub_df)
-        if input_confirmed:
-            return sub_df
-        else:
+        while True:
+            row_input = input("Which row numbers would you like to perform a transfer for?\n")
+            rows = self.parse_row_input(row_input)
+            idxs = [row - 2 for row in rows]
+            sub_df = self.settlements_df.reindex(idxs)
+            missing = sub_df.index[sub_df[constants.REQUIRED_COLUMNS].isna().all(axis=1)]
+            if len(missing) != 0:
+                print(f"Rows {list(missing + 2)} unavailable for transfer. Please ensure that these rows exist and that their NAME column is filled out.")
+                sub_df = sub_df.drop(missing)
+            if sub_df.empty:
+                continue
+
+            input_confirmed = self.row_input_is_correct(sub_df)
+            if input_confirmed:
+                return sub_df
             reinput_prompt = (
                 "Would you like to try inputting the rows again again? (yes/no)\n"
             )
             reinput_confirmed = self.response_is_yes(reinput_prompt)
-            if reinput_confirmed:
-                return self.select_settlements_by_row()
-            else:
+            if not reinput_confirmed:
                 print("No rows selected")
                 return None
 
@@ -140,10 +215,8 @@ class SettlementData:
         """
         Checks with user that the rows they selected are the desired rows.
         """
-        tabulated_rows = tabulate(
-            df_rows[constants.DISPLAY_COLUMNS], headers="keys", tablefmt="psql"
-        )
-        prompt = f"{tabulated_rows}\nAre these the correct rows? (yes/no) \n"
+        displayed_rows = df_rows[constants.DISPLAY_COLUMNS].to_string()
+        prompt = f"{displayed_rows}\nAre these the correct rows? (yes/no) \n"
         return self.response_is_yes(prompt)
 
     def append_more_settlement_rows(self):
@@ -151,11 +224,9 @@ class SettlementData:
         Function for user to add settlements after initializing object.
         """
         df_append = self.select_settlements_by_row()
-        tabulated_rows = tabulate(
-            df_append[constants.DISPLAY_COLUMNS], headers="keys", tablefmt="psql"
-        )
+        displayed_rows = df_append[constants.DISPLAY_COLUMNS].to_string()
 
-        prompt = f"{tabulated_rows} \n Would you like to add these rows to the transfer operation? (yes/no) \n"
+        prompt = f"{displayed_rows} \n Would you like to add these rows to the transfer operation? (yes/no) \n"
         if self.response_is_yes(prompt):
             self.settlement_rows = pd.concat([self.settlement_rows, df_append])
         else:
@@ -165,27 +236,22 @@ class SettlementData:
         """
         Prompts response from user based on prompt (str) and returns response (which should be either y(es) or n(o)) as a boolean. 
         """
-        response = input(prompt).lower().strip()
+        while True:
+            response = input(prompt).lower().strip()
 
-        if response[:1] == "y":
-            return True
-        elif response[:1] == "n":
-            return False
-        else:
+            if response[:1] == "y":
+                return True
+            elif response[:1] == "n":
+                return False
             print('Please respond with "yes" or "no"')
-            return self.response_is_yes(prompt)
 
     def execute_transfers(self):
         """
         Execute bank transfers on the rows specified by user at initialization.
         """
         self.preprocess_settlement_rows_for_transfer()
-        tabulated_rows = tabulate(
-            self.settlement_rows[constants.DISPLAY_COLUMNS],
-            headers="keys",
-            tablefmt="psql",
-        )
-        prompt = f"{tabulated_rows} \n Would you like to execute transfers on these rows? (yes/no)\n"
+        displayed_rows = self.settlement_rows[constants.DISPLAY_COLUMNS].to_string()
+        prompt = f"{displayed_rows} \n Would you like to execute transfers on these rows? (yes/no)\n"
         transfer_confirmed = self.response_is_yes(prompt)
         if not transfer_confirmed:
             print("Transfer not executed")
@@ -197,59 +263,108 @@ class SettlementData:
     def preprocess_settlement_rows_for_transfer(self):
         """
         Preprocess the settlement items before executing bank transfer by doing the following things:
-            1. Drop any duplicates so that no transfer is performed twice
+            1. Drop spreadsheet rows selected more than once so that no transfer is performed twice
         """
-        self.settlement_rows = self.settlement_rows.drop_duplicates()
+        self.settlement_rows = self.settlement_rows[~self.settlement_rows.index.duplicated()]
 
     def convert_settlement_rows_to_transfer_items(self):
         """
         Iterate over settlement_rows and create a SettlementCase for each.
         """
-        return [SettlementCase(row) for _, row in self.settlement_rows.iterrows()]
+        records = self.settlement_rows[constants.REQUIRED_COLUMNS].to_dict(orient="records")
+        return [SettlementCase(record) for record in records]
+
+
+def random_time(max, min=0):
+    """
+    Sample a random time from the interval [min, max] (uniformly distributed).
+    """
+    return random.uniform(min, max)
 
 
 def sleep_random_time(max, min=0):
     """
     Sleep for a random time sampled from the interval [min, max] (uniformly distributed).
     """
-    t = (max - min) * np.random.rand() + min
-    time.sleep(t)
+    time.sleep(random_time(max, min=min))
 
 
 def perform_transfers_via_selenium(transfer_items):
     """
-    Perform appropriate transfers for cases in transfer_items using Selenium webdriver.
+    Perform appropriate transfers for cases in transfer_items using Selenium webdriver. Settlements are split across constants.N_BROWSERS browser sessions, each of which logs in separately and works through its share of settlements concurrently with the others.
+    If any session fails or the user interrupts the run (Ctrl-C), the remaining sessions are stopped before their next transfer and the settlements that were not completed are reported.
+    """
+    if not transfer_items:
+        return
+    user, pwd = prompt_login_credentials()
+    n_browsers = min(constants.N_BROWSERS, len(transfer_items))
+    shards = [transfer_items[i::n_browsers] for i in range(n_browsers)]
+    completed_items = []
+    abort = threading.Event()
+    with ThreadPoolExecutor(max_workers=n_browsers) as executor:
+        futures = [
+            executor.submit(perform_transfers_in_browser, shard, user, pwd, completed_items, abort)
+            for shard in shards
+        ]
+        try:
+            for future in as_completed(futures):
+                future.result()
+        except BaseException as error:
+            # BaseException so that Ctrl-C also stops the sessions rather than waiting for every shard to finish
+            abort.set()
+            executor.shutdown(cancel_futures=True)
+            unprocessed = [item.client_name for item in transfer_items if item not in completed_items]
+            print(f"Transfers aborted: {str(error) or type(error).__name__}")
+            print(f"Transfers were not completed for the following settlements. Some of their transfers may already have gone through, so please check the account activity before trying again:\n{unprocessed}")
+            sys.exit()
+
+
+def perform_transfers_in_browser(transfer_items, user, pwd, completed_items, abort):
+    """
+    Open a new browser, login and perform appropriate transfers for cases in transfer_items.
+
+    Arguments
+    ---------
+        - completed_items (list): Settlements whose transfers have all been made are appended to this list.
+        - abort (threading.Event): Stops this session before its next transfer once set.
     """
     browser = initialize_browser()
-    wait_for_url_load(browser, url="https://www.frostbank.com/")
-    sleep_random_time(5 * constants.SPEED_FACTOR, 2 * constants.SPEED_FACTOR)
-    execute_login(browser)
-    wait_for_url_load(browser, url="https://www.frostbank.com/mf/accounts/main")
-    sleep_random_time(5 * constants.SPEED_FACTOR, 2 * constants.SPEED_FACTOR)
-    verify_login(browser)
-    navigate_to_transfers(browser)
-    for settlement_item in transfer_items:
-        transfer_dict = initialize_transfer_dict(settlement_item)
-        for order in transfer_dict:
-            wait_for_url_load(browser, url="https://www.frostbank.com/mf/transfers/main")
-            sleep_random_time(5 * constants.SPEED_FACTOR, 2 * constants.SPEED_FACTOR)
-            verify_navigation_to_transfers(browser)
-            complete_transfer_form(browser, order)
-            click_next(browser)
-            wait_for_url_load(browser, url="https://www.frostbank.com/mf/transfers/verify")
-            sleep_random_time(5 * constants.SPEED_FACTOR, 2 * constants.SPEED_FACTOR)
-            submit_transfer(browser)
-            wait_for_url_load(browser, url="https://www.frostbank.com/mf/transfers/confirm")
-            sleep_random_time(5 * constants.SPEED_FACTOR, 2 * constants.SPEED_FACTOR)
-            click_make_another_transfer(browser)
-
-    browser.close()
+    try:
+        wait_for_url_load(browser, url="https://www.frostbank.com/")
+        sleep_random_time(5 * constants.SPEED_FACTOR, 2 * constants.SPEED_FACTOR)
+        execute_login(browser, user, pwd)
+        wait_for_url_load(browser, url="https://www.frostbank.com/mf/accounts/main")
+        sleep_random_time(5 * constants.SPEED_FACTOR, 2 * constants.SPEED_FACTOR)
+        verify_login(browser)
+        navigate_to_transfers(browser)
+        for settlement_item in transfer_items:
+            transfer_dict = initialize_transfer_dict(settlement_item)
+            for order in transfer_dict:
+                if abort.is_set():
+                    return
+                wait_for_url_load(browser, url="https://www.frostbank.com/mf/transfers/main")
+                sleep_random_time(5 * constants.SPEED_FACTOR, 2 * constants.SPEED_FACTOR)
+                verify_navigation_to_transfers(browser)
+                form = locate_transfer_form(browser)
+                complete_transfer_form(browser, form, order)
+                click_next(form["next"])
+                wait_for_url_load(browser, url="https://www.frostbank.com/mf/transfers/verify")
+                sleep_random_time(5 * constants.SPEED_FACTOR, 2 * constants.SPEED_FACTOR)
+                submit_transfer(browser)
+                wait_for_url_load(browser, url="https://www.frostbank.com/mf/transfers/confirm")
+                sleep_random_time(5 * constants.SPEED_FACTOR, 2 * constants.SPEED_FACTOR)
+                click_make_another_transfer(browser)
+            completed_items.append(settlement_item)
+    finally:
+        browser.close()
 
 
 def initialize_browser():
     """
     Initializes and returns a chromedriver browser
     """
+    from selenium import webdriver
+
     options = webdriver.ChromeOptions()
     options.add_argument("--disable-extensions")
     options.add_argument("--profile-directory=Default")
@@ -266,27 +381,28 @@ def initialize_browser():
     return browser
 
 
-def execute_login(browser):
+def prompt_login_credentials():
     """
-    Performs login by prompting by receiving username and password from user
+    Prompt user for their username and password. These are collected once and shared by every browser session.
     """
-    i = 0
-    while i < 5:
-        try:
-            user_field = browser.find_element_by_id("username-field")
-            break
-        except:
-            print("Cannot find username field. Waiting and trying again...")
-            sleep_random_time(3 * constants.SPEED_FACTOR, 2 * constants.SPEED_FACTOR)
-            i = i + 1
-    user_field.clear()
     user = input("Enter Username: ")
+    pwd = getpass()
+    return user, pwd
+
+
+def execute_login(browser, user, pwd):
+    """
+    Performs login using the username and password received from user
+    """
+    from selenium.webdriver.common.keys import Keys
+
+    user_field = wait_for_element(browser, "username-field")
+    user_field.clear()
     sleep_random_time(5 * constants.SPEED_FACTOR, min=2 * constants.SPEED_FACTOR)
     user_field.send_keys(user)
     sleep_random_time(5 * constants.SPEED_FACTOR, min=2 * constants.SPEED_FACTOR)
     pass_field = browser.find_element_by_id("password-field")
     pass_field.clear()
-    pwd = getpass()
     sleep_random_time(5 * constants.SPEED_FACTOR, min=2 * constants.SPEED_FACTOR)
     pass_field.send_keys(pwd)
     pass_field.send_keys(Keys.RETURN)
@@ -297,10 +413,9 @@ def verify_login(browser):
     Verify that login was successful.
     """
     if not browser.current_url == "https://www.frostbank.com/mf/accounts/main":
-        print(
+        raise Exception(
             "Failed to login. Check that username and password were entered correctly"
         )
-        sys.exit()
 
 
 def navigate_to_transfers(browser):
@@ -310,27 +425,22 @@ def navigate_to_transfers(browser):
         2. Down arrow
         3. Enter
     """
-    i = 0
-    while i < 5:
-        try:
-            transfers_tab = browser.find_element_by_id("tabTransfers")
-            break
-        except:
-            print ("Cannot find Transfers tab. Waiting and trying again...")
-            sleep_random_time(3 * constants.SPEED_FACTOR, 2 * constants.SPEED_FACTOR)
-            i = i + 1
+    from selenium.webdriver.common.action_chains import ActionChains
+    from selenium.webdriver.common.keys import Keys
+
+    wait_for_element(browser, "tabTransfers")
     actions = ActionChains(browser)
     for _ in range(3):
         # actions.key_down(Keys.SHIFT)
         actions.send_keys(Keys.TAB)
         # actions.key_up(Keys.SHIFT)
-        wait_time = 0.5 * np.random.rand() + 0.5
+        wait_time = random.uniform(0.5, 1.0)
         actions.pause(wait_time)
     actions.send_keys(Keys.ARROW_DOWN)
-    wait_time = 0.5 * np.random.rand() + 0.5
+    wait_time = random.uniform(0.5, 1.0)
     actions.pause(wait_time)
     actions.send_keys(Keys.ENTER)
-    wait_time = 0.5 * np.random.rand() + 0.5
+    wait_time = random.uniform(0.5, 1.0)
     actions.pause(wait_time)
     actions.perform()
 
@@ -338,41 +448,18 @@ def navigate_to_transfers(browser):
 def initialize_transfer_dict(settlement_item):
     """
     Extract transfer info from settlement_item and store in dict. This could be replaced with a BankTransfer object and SettlementCase could just be called SettlementCase in the future...
-    """
-    transfer_dict = [
-    dict(
-        from_acct="Iolta",
-        to_acct="Operating",
-        from_acct_num=str(constants.IOLTA_ACCT_NUM),
-        to_acct_num=str(constants.OPERATING_ACCT_NUM),
-        amount=settlement_item.amount_iolta_to_operating,
-        name=settlement_item.client_name
-    ),
-    dict(
-        from_acct="Operating",
-        to_acct="Marketing",
-        from_acct_num=str(constants.OPERATING_ACCT_NUM),
-        to_acct_num=str(constants.MARKETING_ACCT_NUM),
-        amount=settlement_item.amount_operating_to_marketing,
-        name=settlement_item.client_name
-    ),
-    dict(
-        from_acct="Operating",
-        to_acct="Cash Loan Repayment Fund",
-        from_acct_num=str(constants.OPERATING_ACCT_NUM),
-        to_acct_num=str(constants.CASH_ACCT_NUM),
-        amount=settlement_item.amount_operating_to_cash,
-        name=settlement_item.client_name
-    ),
-    dict(
-        from_acct="Operating",
-        to_acct="Building",
-        from_acct_num=str(constants.OPERATING_ACCT_NUM),
-        to_acct_num=str(constants.BUILDING_ACCT_NUM),
-        amount=settlement_item.amount_operating_to_building,
-        name=settlement_item.client_name
-    ),
-    ]
+    Transfers with a zero or blank amount are skipped, and a negative amount raises an exception before any of the settlement's transfers are made.
+    """
+    transfer_dict = []
+    for template, amount_attr in TRANSFER_TEMPLATES:
+        amount = getattr(settlement_item, amount_attr)
+        if pd.isna(amount) or amount == 0:
+            continue
+        if amount < 0:
+            raise Exception(
+                f"Negative amount {amount} for the {template['from_acct']} to {template['to_acct']} transfer of {settlement_item.client_name}. Please correct the spreadsheet before attempting a transfer."
+            )
+        transfer_dict.append({**template, "amount": amount, "name": settlement_item.client_name})
     return transfer_dict
 
 
@@ -386,73 +473,97 @@ def verify_navigation_to_transfers(browser):
         )
 
 
-def complete_transfer_form(browser, order):
+def locate_transfer_form(browser, timeout=15):
+    """
+    Wait until the transfer form has loaded and locate its elements with a single script call. Returns a dict of element handles keyed by "from", "to", "amount", "memo" and "next".
+    """
+    from selenium.common.exceptions import TimeoutException
+    from selenium.webdriver.support.ui import WebDriverWait
+
+    def form_is_loaded(browser):
+        form = browser.execute_script(TRANSFER_FORM_SCRIPT)
+        return form if None not in form.values() else False
+
+    try:
+        return WebDriverWait(browser, timeout).until(form_is_loaded)
+    except TimeoutException:
+        raise Exception("Failed to locate the transfer form.")
+
+
+def complete_transfer_form(browser, form, order):
     """
-    Complete transfer form based on order.
+    Complete transfer form based on order using the element handles in form (see locate_transfer_form). The accounts are selected first, as each dropdown has to be open before its rows can be found; the amount and memo are then sent to the browser as one ActionChains batch.
     """
-    select_from_account(browser, order)
-    select_to_account(browser, order)
-    insert_amount(browser, order)
-    insert_memo(browser, order)
+    from selenium.webdriver.common.action_chains import ActionChains
+
+    select_from_account(browser, form["from"], order)
+    select_to_account(browser, form["to"], order)
+    actions = ActionChains(browser)
+    insert_amount(actions, form["amount"], order)
+    insert_memo(actions, form["memo"], order)
+    actions.perform()
 
 
-def select_from_account(browser, order):
+def select_from_account(browser, from_acct_dropdown, order):
     """
     Select account to transfer funds from based on order.
     """
-    i = 0
-    while i < 5:
-        try:
-            from_acct_dropdown = browser.find_element_by_id("from-account-list")
-            break
-        except:
-            print("Cannot find list of accounts. Waiting and trying again...")
-            sleep_random_time(3 * constants.SPEED_FACTOR, 2 * constants.SPEED_FACTOR)
-            i = i+1
     from_acct_dropdown.click()
     sleep_random_time(5 * constants.SPEED_FACTOR, min=2 * constants.SPEED_FACTOR)
-    from_acct_row = from_acct_dropdown.find_elements_by_xpath(
-        f"//*[contains(text(), \"{order['from_acct_num']}\")]"
-    )[0]
+    from_acct_row = wait_for_account_row(browser, from_acct_dropdown, order["from_acct_num"])
     from_acct_row.click()
-    sleep_random_time(5 * constants.SPEED_FACTOR, min=2* constants.SPEED_FACTOR)
-    
+    sleep_random_time(5 * constants.SPEED_FACTOR, min=2 * constants.SPEED_FACTOR)
+
 
-def select_to_account(browser, order):
+def select_to_account(browser, to_acct_dropdown, order):
     """
     Select account to transfer funds to based on order.
     """
-    to_acct_dropdown = browser.find_element_by_id("to-account-list")
     to_acct_dropdown.click()
     sleep_random_time(5 * constants.SPEED_FACTOR, min=2 * constants.SPEED_FACTOR)
-    to_acct_row = to_acct_dropdown.find_elements_by_xpath(f"//*[contains(text(), \"{order['to_acct_num']}\")]")[0]
+    to_acct_row = wait_for_account_row(browser, to_acct_dropdown, order["to_acct_num"])
     to_acct_row.click()
     sleep_random_time(5 * constants.SPEED_FACTOR, min=2 * constants.SPEED_FACTOR)
 
 
-def insert_amount(browser, order):
+def wait_for_account_row(browser, acct_dropdown, acct_num, timeout=15):
     """
-    Insert amount to be transferred based on order.
+    Wait until the row for acct_num is present in the opened acct_dropdown and return it.
     """
-    amount_field = browser.find_element_by_id("amount")
-    amount_field.send_keys(str(order["amount"]))
-    sleep_random_time(5 * constants.SPEED_FACTOR, min=2 * constants.SPEED_FACTOR)
+    from selenium.common.exceptions import TimeoutException
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support.ui import WebDriverWait
+
+    try:
+        return WebDriverWait(browser, timeout).until(
+            lambda _: acct_dropdown.find_element(
+                By.XPATH, f".//*[contains(normalize-space(text()), \"{acct_num}\")]"
+            )
+        )
+    except TimeoutException:
+        raise Exception(f"Failed to find account {acct_num} in the opened account list.")
 
 
-def insert_memo(browser, order):
+def insert_amount(actions, amount_field, order):
     """
-    Insert memo (client's name) based on order.
+    Queue insertion of the amount to be transferred based on order on actions (ActionChains).
     """
-    memo_field = browser.find_element_by_id("memo")
-    memo_field.send_keys(order['name'])
-    sleep_random_time(5 * constants.SPEED_FACTOR, min=2 * constants.SPEED_FACTOR)
+    actions.send_keys_to_element(amount_field, str(order["amount"]))
+    actions.pause(random_time(5 * constants.SPEED_FACTOR, min=2 * constants.SPEED_FACTOR))
+
+
+def insert_memo(actions, memo_field, order):
+    """
+    Queue insertion of the memo (client's name) based on order on actions (ActionChains).
+    """
+    actions.send_keys_to_element(memo_field, order["name"])
+    actions.pause(random_time(5 * constants.SPEED_FACTOR, min=2 * constants.SPEED_FACTOR))
 
 
-def click_next(browser):
+def click_next(next_btn):
     """
-    Click "Next" button after completing transfer form
+    Click "Next" button (next_btn) after completing transfer form
     """
-    next_btn = browser.find_element_by_id("btn-next")
     next_btn.click()
 
 
@@ -460,15 +571,7 @@ def submit_transfer(browser):
     """
     Submit transfer form by clicking appropriate button.
     """
-    i = 0
-    while i < 5:
-        try:
-            submit_btn = browser.find_element_by_id("btn-submit")
-            break
-        except:
-            print("Cannot find submit button. Waiting and trying again...")
-            sleep_random_time(3 * constants.SPEED_FACTOR, 2 * constants.SPEED_FACTOR)
-            i = i + 1
+    submit_btn = wait_for_element(browser, "btn-submit")
     submit_btn.click()
 
 
@@ -476,28 +579,39 @@ def click_make_another_transfer(browser):
     """
     Click "Make another transfer" button after submitting transfer
     """
-    i = 0
-    while i < 5:
-        try:
-            submit_btn = browser.find_element_by_id("btn-submit")
-            break
-        except:
-            print("Cannot find submit button. Waiting and trying again...")
-            sleep_random_time(3 * constants.SPEED_FACTOR, 2 * constants.SPEED_FACTOR)
-            i = i + 1
+    submit_btn = wait_for_element(browser, "btn-submit")
     submit_btn.click()
 
 
 def wait_for_url_load(browser, url, wait_time=1.5, max_iter=10):
     """
-    Sleep until URL has loaded and abort after 10 failed iterations.
+    Wait until URL has loaded and raise an exception after max_iter * wait_time seconds.
+    """
+    from selenium.common.exceptions import TimeoutException
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.webdriver.support.ui import WebDriverWait
+
+    try:
+        WebDriverWait(browser, max_iter * wait_time).until(EC.url_to_be(url))
+    except TimeoutException:
+        raise Exception(f"Failed to reach {url}.")
+
+
+def wait_for_element(browser, element_id, timeout=15):
+    """
+    Wait until the element with id element_id is present and return it. Raise an exception after timeout seconds.
     """
-    i = 0
-    while browser.current_url != url:
-        i = i + 1
-        if i > max_iter:
-            print(f"Failed to reach {url}. Aborting, please try again.")
-        time.sleep(wait_time)
+    from selenium.common.exceptions import TimeoutException
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.webdriver.support.ui import WebDriverWait
+
+    try:
+        return WebDriverWait(browser, timeout).until(
+            EC.presence_of_element_located((By.ID, element_id))
+        )
+    except TimeoutException:
+        raise Exception(f"Failed to find element {element_id} on {browser.current_url}.")
 
 
 if __name__ == "__main__":